@@ -31,14 +31,25 @@ Enumerar *todos* os caminhos hamiltonianos pode ser exponencial. Use --all com c
 """
 
 from __future__ import annotations
+from array import array
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Dict, List, Set, Iterable, Tuple, Optional
+from functools import lru_cache
+from itertools import chain
+from typing import Dict, List, Set, Iterable, KeysView, Tuple, Optional
 import argparse
 import sys
 import json
 import os
 
+try:  # opcional: acelera o backtracking compilando o núcleo com Numba
+    import numpy as np
+    from numba import njit, types
+except ImportError:
+    np = None
+    njit = None
+
 
 @dataclass
 class Graph:
@@ -58,8 +69,8 @@ class Graph:
             self.adj[v].add(u)
 
     @property
-    def vertices(self) -> List[str]:
-        return list(self.adj.keys())
+    def vertices(self) -> KeysView[str]:
+        return self.adj.keys()  # view, sem copiar a lista de vértices
 
     def neighbors(self, u: str) -> Iterable[str]:
         return self.adj[u]
@@ -81,111 +92,532 @@ def parse_graph(path: str, directed_override: Optional[bool] = None) -> Graph:
                 g.add_vertex(v)
                 g.add_edge(u, v)
         if directed_override is not None and directed_override != g.directed:
-            # Se o usuário quiser forçar outra direção, reconstruímos
+            # Força outra direção copiando a adjacência já montada (num grafo
+            # não-dirigido ela tem u->v e v->u, então as duas direções são mantidas).
+            # Todo v já é chave de g.adj, então add_vertex(u) basta para criar os
+            # vértices (inclusive isolados) na mesma ordem de g.
             g2 = Graph(directed_override)
-            # Reinsere as arestas respeitando a direção desejada
             for u, nbrs in g.adj.items():
+                g2.add_vertex(u)
                 for v in nbrs:
-                    if g.directed or directed_override:  # se qualquer um for dirigido, u->v é mantido
-                        g2.add_vertex(u); g2.add_vertex(v); g2.add_edge(u, v)
-                    else:
-                        g2.add_vertex(u); g2.add_vertex(v); g2.add_edge(u, v)  # não dirigido já duplica
+                    g2.add_edge(u, v)
             return g2
         return g
 
-    # Formato .txt
+    # Formato .txt: lê o arquivo inteiro de uma vez e trabalha sobre bytes;
+    # só os rótulos dos vértices são decodificados, no final.
     directed = False
-    declared_vertices: List[str] = []
-    edges: List[Tuple[str, str]] = []
-
-    with open(path, "r", encoding="utf-8") as f:
-        for raw in f:
-            line = raw.strip()
-            if not line or line.startswith("#"):
+    declared_vertices: List[bytes] = []
+    index: Dict[bytes, int] = {}  # rótulo -> índice, na ordem em que aparece nas arestas
+    src = array("i")
+    dst = array("i")
+
+    with open(path, "rb") as f:
+        data = f.read()
+
+    for raw in data.split(b"\n"):
+        parts = raw.split()
+        if not parts or parts[0][:1] == b"#":
+            continue
+        # só linhas começando com D/V podem ser diretivas
+        if parts[0][:1] in b"DdVv":
+            head = parts[0].upper()
+            if head.startswith(b"DIRECTED="):
+                value = raw.split(b"=", 1)[1].strip()
+                directed = value in (b"1", b"true", b"True", b"TRUE")
                 continue
-            if line.upper().startswith("DIRECTED="):
-                value = line.split("=", 1)[1].strip()
-                directed = value in ("1", "true", "True", "TRUE")
+            if head.startswith(b"V="):
+                declared_vertices.extend(raw.split(b"=", 1)[1].split())
                 continue
-            if line.upper().startswith("V="):
-                after = line.split("=", 1)[1].strip()
-                declared_vertices.extend(after.split())
-                continue
-            # aresta "u v"
-            parts = line.split()
-            if len(parts) != 2:
-                raise ValueError(f"Linha inválida na entrada: {line!r}. Esperado formato 'u v'.")
-            u, v = parts
-            edges.append((u, v))
+        # aresta "u v"
+        if len(parts) != 2:
+            line = raw.strip().decode("utf-8")
+            raise ValueError(f"Linha inválida na entrada: {line!r}. Esperado formato 'u v'.")
+        src.append(index.setdefault(parts[0], len(index)))
+        dst.append(index.setdefault(parts[1], len(index)))
 
     if directed_override is not None:
         directed = directed_override
 
+    labels = [v.decode("utf-8") for v in index]
     g = Graph(directed=directed)
     for v in declared_vertices:
+        g.add_vertex(v.decode("utf-8"))
+    for v in labels:
         g.add_vertex(v)
-    for u, v in edges:
-        g.add_vertex(u)
-        g.add_vertex(v)
-        g.add_edge(u, v)
+    for u, v in zip(src, dst):
+        g.add_edge(labels[u], labels[v])
     return g
 
 
-def _order_candidates_by_heuristic(g: Graph, candidates: Iterable[str]) -> List[str]:
-    """Heurística simples: ordena por grau crescente para reduzir branching."""
-    return sorted(candidates, key=lambda x: len(g.adj[x]))
+def _index_graph(g: Graph) -> Tuple[List[str], Dict[str, int], List[int]]:
+    """
+    Numera os vértices (0..n-1) e monta a adjacência como bitmask:
+    o bit j de adj_mask[i] indica a aresta i -> j.
+    Laços (u -> u) são descartados, pois nunca fazem parte de um caminho hamiltoniano.
+    """
+    labels = list(g.adj)  # índice -> rótulo (o único lugar que precisa de uma lista)
+    index = {v: i for i, v in enumerate(labels)}
+    adj_mask = [0] * len(labels)
+    for u, nbrs in g.adj.items():
+        i = index[u]
+        mask = 0
+        for v in nbrs:
+            mask |= 1 << index[v]
+        adj_mask[i] = mask & ~(1 << i)
+    return labels, index, adj_mask
+
+
+def _feasible_starts(adj_mask: List[int], directed: bool) -> int:
+    """
+    Condições necessárias, em O(n + m), checadas antes do backtracking.
+    Retorna o bitmask dos vértices que podem iniciar um caminho hamiltoniano
+    (0 = nenhum caminho existe):
+    - o grafo subjacente (ignorando direções) precisa ser conexo;
+    - não-dirigido: no máximo 2 vértices de grau 1; com exatamente 2, eles são
+      as duas pontas e todo caminho começa por um deles;
+    - dirigido: no máximo 1 vértice sem arestas de entrada (ele é o início) e no
+      máximo 1 sem arestas de saída (ele é o fim).
+    """
+    n = len(adj_mask)
+    full = (1 << n) - 1
+    if n == 1:
+        return full
+
+    in_mask = [0] * n
+    for u, mask in enumerate(adj_mask):
+        while mask:
+            b = mask & -mask
+            mask ^= b
+            in_mask[b.bit_length() - 1] |= 1 << u
+
+    # conectividade do grafo subjacente (BFS por bitmask a partir do vértice 0)
+    reach = frontier = 1
+    while frontier:
+        b = frontier & -frontier
+        frontier ^= b
+        i = b.bit_length() - 1
+        new = (adj_mask[i] | in_mask[i]) & ~reach
+        reach |= new
+        frontier |= new
+    if reach != full:
+        return 0
+
+    if not directed:
+        leaves = 0
+        for i, mask in enumerate(adj_mask):
+            if (mask & (mask - 1)) == 0:  # grau 1 (grau 0 já seria desconexo)
+                leaves |= 1 << i
+        count = leaves.bit_count()
+        if count > 2:
+            return 0
+        return leaves if count == 2 else full
+
+    sources = 0
+    sinks = 0
+    for i in range(n):
+        if not in_mask[i]:
+            sources |= 1 << i
+        if not adj_mask[i]:
+            sinks |= 1 << i
+    if sources.bit_count() > 1 or sinks.bit_count() > 1:
+        return 0
+    return sources or full
+
+
+def _can_complete(adj_mask: List[int], curr: int, visited: int, full: int, directed: bool) -> bool:
+    """
+    Podas aplicadas antes de expandir um nó (False = nenhuma extensão do caminho
+    atual, que termina em curr, consegue visitar todos os vértices):
+    - dirigido: todo vértice não visitado, exceto o último do caminho, precisa
+      ter ao menos um vizinho também não visitado;
+    - não-dirigido: todo vértice não visitado precisa de 2 vizinhos entre os
+      não visitados + curr, exceto no máximo um (a ponta final), que precisa de 1;
+    - conectividade: a partir dos vizinhos livres de curr, uma BFS restrita aos
+      não visitados precisa alcançar todos eles.
+    """
+    unvisited = full ^ visited
+    reachable_from = unvisited if directed else unvisited | (1 << curr)
+    low = 0
+    rest = unvisited
+    while rest:
+        b = rest & -rest
+        rest ^= b
+        nbrs = adj_mask[b.bit_length() - 1] & reachable_from
+        if directed:
+            if not nbrs:
+                low += 1
+        elif (nbrs & (nbrs - 1)) == 0:  # menos de 2 vizinhos
+            if not nbrs:
+                return False
+            low += 1
+        if low > 1:
+            return False
+
+    # BFS por bitmask: a fronteira é expandida com OR das linhas de adjacência
+    reach = frontier = adj_mask[curr] & unvisited
+    while frontier:
+        b = frontier & -frontier
+        frontier ^= b
+        new = adj_mask[b.bit_length() - 1] & unvisited & ~reach
+        reach |= new
+        frontier |= new
+    return reach == unvisited
+
+
+# Limite padrão de caminhos coletados com --all (define o tamanho do buffer de saída).
+DEFAULT_MAX_PATHS = 1000
+
+# Núcleo compilado (Numba): mesmo backtracking e mesmas podas da versão em Python,
+# mas iterativo e sobre int64, o que limita o grafo a 63 vértices (um bit por vértice).
+_JIT_MAX_VERTICES = 63
+
+if njit is not None:
+
+    # Assinaturas explícitas: compila na importação (ou carrega do cache) e evita a
+    # inferência de tipos. Auxiliares chamadas só de código compilado dispensam o
+    # wrapper CPython; _bt_core precisa dele por ser chamado do Python.
+    # Cada função tem uma variante com as tabelas do grafo (adj, nbr, nbr_len)
+    # somente leitura, que é como chegam do núcleo especializado.
+    _rw_1d, _rw_2d = types.int64[::1], types.int64[:, ::1]
+    _ro_1d = types.Array(types.int64, 1, "C", readonly=True)
+    _ro_2d = types.Array(types.int64, 2, "C", readonly=True)
+    _TABLES = ((_rw_1d, _rw_2d), (_ro_1d, _ro_2d))
+
+    @njit(types.int64(types.int64), cache=True, no_cpython_wrapper=True)
+    def _popcount64(x):
+        c = 0
+        while x:
+            x &= x - 1
+            c += 1
+        return c
+
+    @njit([types.boolean(t1, types.int64, types.int64, types.int64, types.boolean) for t1, _ in _TABLES],
+          cache=True, no_cpython_wrapper=True)
+    def _can_complete_jit(adj, curr, visited, full, directed):
+        """Versão compilada de _can_complete (o índice do bit b é popcount(b - 1))."""
+        unvisited = full ^ visited
+        if directed:
+            reachable_from = unvisited
+        else:
+            reachable_from = unvisited | (1 << curr)
+        low = 0
+        rest = unvisited
+        while rest:
+            b = rest & -rest
+            rest ^= b
+            nbrs = adj[_popcount64(b - 1)] & reachable_from
+            if directed:
+                if nbrs == 0:
+                    low += 1
+            elif (nbrs & (nbrs - 1)) == 0:
+                if nbrs == 0:
+                    return False
+                low += 1
+            if low > 1:
+                return False
+
+        reach = adj[curr] & unvisited
+        frontier = reach
+        while frontier:
+            b = frontier & -frontier
+            frontier ^= b
+            new = adj[_popcount64(b - 1)] & unvisited & ~reach
+            reach |= new
+            frontier |= new
+        return reach == unvisited
+
+    @njit([types.int64(t1, t2, t1, types.int64, types.int64, types.int64, types.boolean, _rw_1d)
+           for t1, t2 in _TABLES], cache=True, no_cpython_wrapper=True)
+    def _expand_jit(adj, nbr, nbr_len, curr, visited, full, directed, out_cand):
+        """Preenche out_cand com os candidatos de curr em ordem de Warnsdorff; retorna quantos são."""
+        if not _can_complete_jit(adj, curr, visited, full, directed):
+            return 0
+        unvisited = full ^ visited
+        last = (unvisited & (unvisited - 1)) == 0
+        k = 0
+        for i in range(nbr_len[curr]):
+            v = nbr[curr, i]
+            if (unvisited >> v) & 1 and (last or (adj[v] & unvisited) != 0):
+                out_cand[k] = v
+                k += 1
+        # insertion sort estável por número de vizinhos livres (listas curtas)
+        for i in range(1, k):
+            v = out_cand[i]
+            score = _popcount64(adj[v] & unvisited)
+            j = i - 1
+            while j >= 0 and _popcount64(adj[out_cand[j]] & unvisited) > score:
+                out_cand[j + 1] = out_cand[j]
+                j -= 1
+            out_cand[j + 1] = v
+        return k
+
+    @njit([types.int64(t1, t2, t1, types.int64, types.int64, types.boolean, _rw_2d, _rw_1d, _rw_1d)
+           for t1, t2 in _TABLES], cache=True, nogil=True)
+    def _bt_core(adj, nbr, nbr_len, n, start, directed, out_paths, out_count, stop):
+        """
+        Backtracking iterativo a partir de `start`: cada caminho completo é gravado
+        (como índices) na linha out_count[0] de out_paths, que então avança. Para ao
+        encher out_paths ou quando outra thread liga stop[0]. Retorna quantos
+        caminhos gravou nesta chamada.
+        """
+        full = (1 << n) - 1
+        path = np.empty(n, np.int64)
+        cand = np.empty((n, n), np.int64)
+        cand_len = np.zeros(n, np.int64)
+        cand_pos = np.zeros(n, np.int64)
+        count = 0
+
+        path[0] = start
+        visited = 1 << start
+        if visited == full:
+            out_paths[out_count[0], 0] = start
+            out_count[0] += 1
+            return 1
+        cand_len[0] = _expand_jit(adj, nbr, nbr_len, start, visited, full, directed, cand[0])
+        depth = 0
+        while depth >= 0:
+            if stop[0]:
+                return count
+            if cand_pos[depth] == cand_len[depth]:
+                visited ^= 1 << path[depth]
+                depth -= 1
+                continue
+            v = cand[depth, cand_pos[depth]]
+            cand_pos[depth] += 1
+            depth += 1
+            path[depth] = v
+            visited |= 1 << v
+            if visited == full:
+                out_paths[out_count[0], :] = path
+                out_count[0] += 1
+                count += 1
+                if out_count[0] == out_paths.shape[0]:
+                    return count
+                visited ^= 1 << v
+                depth -= 1
+                continue
+            cand_len[depth] = _expand_jit(adj, nbr, nbr_len, v, visited, full, directed, cand[depth])
+            cand_pos[depth] = 0
+        return count
+
+else:
+    _bt_core = None
+
 
+def _jit_tables(adj_mask: List[int], nbr_sorted: List[List[int]]):
+    """
+    Monta as tabelas contíguas (NumPy, int64) consumidas por _bt_core:
+    - adj_arr[i]: linha de adjacência de i como bitmask (n <= 63, uma palavra por linha);
+    - nbr_arr[i, :nbr_len[i]]: vizinhos de i na ordem de nbr_sorted (matriz com padding).
+    """
+    n = len(adj_mask)
+    adj_arr = np.array(adj_mask, dtype=np.int64)
+    nbr_len = np.fromiter(map(len, nbr_sorted), dtype=np.int64, count=n)
+    total = int(nbr_len.sum())
+    nbr_arr = np.zeros((n, max(1, int(nbr_len.max()))), dtype=np.int64)
+    # preenche todas as linhas de uma vez: (linha, coluna) de cada vizinho na lista achatada
+    rows = np.repeat(np.arange(n), nbr_len)
+    cols = np.arange(total) - np.repeat(np.cumsum(nbr_len) - nbr_len, nbr_len)
+    nbr_arr[rows, cols] = np.fromiter(chain.from_iterable(nbr_sorted), dtype=np.int64, count=total)
+    return adj_arr, nbr_arr, nbr_len
+
+
+# Núcleos já especializados, por grafo (bytes de adj_arr; nbr_arr deriva dela).
+_specialized_cores: Dict[bytes, object] = {}
 
-def hamiltonian_paths(g: Graph, start: Optional[str] = None, all_paths: bool = False) -> List[List[str]]:
+
+def _specialized_core(adj_arr, nbr_arr, nbr_len):
+    """
+    Gera (ou reaproveita) uma versão de _bt_core específica para um grafo: as
+    tabelas ficam capturadas na closure, que o Numba congela como constantes
+    embutidas no código compilado, e o LLVM otimiza o núcleo para esses valores.
+    A compilação extra não vai para o cache em disco, então só compensa em
+    enumerações longas (--all) ou consultas repetidas ao mesmo grafo.
+    """
+    key = adj_arr.tobytes()
+    core = _specialized_cores.get(key)
+    if core is None:
+        def core(n, start, directed, out_paths, out_count, stop):
+            return _bt_core(adj_arr, nbr_arr, nbr_len, n, start, directed, out_paths, out_count, stop)
+
+        core = njit(nogil=True)(core)
+        _specialized_cores[key] = core
+    return core
+
+
+def hamiltonian_paths(
+    g: Graph,
+    start: Optional[str] = None,
+    all_paths: bool = False,
+    max_paths: int = DEFAULT_MAX_PATHS,
+    specialize: bool = False,
+) -> List[List[str]]:
     """
     Retorna uma lista com 1 ou vários caminhos hamiltonianos.
     - start: vértice inicial fixo, se None tenta iniciar de cada vértice.
     - all_paths: se True, coleta todos os caminhos; senão, para ao achar o primeiro.
+    - max_paths: com all_paths, para ao coletar esse número de caminhos.
+    - specialize: compila um núcleo específico para este grafo (só com Numba).
 
     Complexidade: O(exponencial) no pior caso, típico de backtracking.
     """
+    if all_paths and max_paths < 1:
+        raise ValueError("max_paths deve ser pelo menos 1.")
     n = len(g.adj)
     if n == 0:
         return []
 
-    results: List[List[str]] = []
-    vertices = list(g.adj.keys())
-
-    def backtrack(curr: str, visited: Set[str], path: List[str]) -> bool:
-        if len(path) == n:
-            results.append(path.copy())
-            return not all_paths  # True se queremos parar cedo
-
-        # candidatos são vizinhos ainda não visitados
-        nxt_candidates = [v for v in g.neighbors(curr) if v not in visited]
-
-        # heurística de ordenação
-        for nxt in _order_candidates_by_heuristic(g, nxt_candidates):
-            visited.add(nxt)
-            path.append(nxt)
-            should_stop = backtrack(nxt, visited, path)
-            path.pop()
-            visited.remove(nxt)
-            if should_stop:
-                return True
+    if start is not None and start not in g.adj:
+        raise ValueError(f"O vértice inicial '{start}' não existe no grafo.")
+
+    labels, index, adj_mask = _index_graph(g)
+    feasible = _feasible_starts(adj_mask, g.directed)
+    if start is not None:
+        feasible &= 1 << index[start]
+    if not feasible:
+        return []
+    full = (1 << n) - 1
+    deg_arr = [mask.bit_count() for mask in adj_mask]  # grau (de saída) por índice
+
+    # Vizinhos de cada vértice já ordenados por grau crescente (empate pelo índice),
+    # calculado uma única vez em vez de reordenar a cada nó da busca.
+    nbr_sorted: List[List[int]] = [
+        sorted((v for v in range(n) if (adj_mask[u] >> v) & 1), key=deg_arr.__getitem__)
+        for u in range(n)
+    ]
+
+    # O mesmo estado (curr, visited) reaparece em vários ramos (ordens diferentes
+    # do mesmo conjunto de vértices terminando em curr), então o resultado das
+    # podas + ordenação é memorizado por estado, com tamanho limitado.
+    @lru_cache(maxsize=1 << 16)
+    def expand(curr: int, visited: int) -> Tuple[int, ...]:
+        """Candidatos a seguir curr, em ordem (vazio se o estado foi podado)."""
+        if not _can_complete(adj_mask, curr, visited, full, g.directed):
+            return ()
+        # candidatos são vizinhos ainda não visitados; Warnsdorff: primeiro os que
+        # têm menos vizinhos livres (sort estável mantém o grau como desempate)
+        unvisited = full ^ visited
+        # candidato sem nenhum vizinho livre é beco sem saída, a menos que seja
+        # o último vértice que falta (aí ele fecha o caminho)
+        last = (unvisited & (unvisited - 1)) == 0
+        nxt_candidates = [
+            v for v in nbr_sorted[curr] if (unvisited >> v) & 1 and (last or adj_mask[v] & unvisited)
+        ]
+        nxt_candidates.sort(key=lambda v: (adj_mask[v] & unvisited).bit_count())
+        return tuple(nxt_candidates)
+
+    # Caminhos encontrados ficam como linhas de n índices num buffer alocado uma
+    # única vez; a busca para quando ele enche (1 linha se não queremos todos).
+    # Os rótulos só são montados no final.
+    cap = max_paths if all_paths else 1
+    use_jit = _bt_core is not None and n <= _JIT_MAX_VERTICES
+    if use_jit:
+        adj_arr, nbr_arr, nbr_len = _jit_tables(adj_mask, nbr_sorted)
+        out = np.empty((cap, n), dtype=np.int64)
+        out_count = np.zeros(1, dtype=np.int64)
+        if specialize:
+            spec_core = _specialized_core(adj_arr, nbr_arr, nbr_len)
+
+            def run_core(s: int, buf, count, stop) -> None:
+                spec_core(n, s, g.directed, buf, count, stop)
+        else:
+            def run_core(s: int, buf, count, stop) -> None:
+                _bt_core(adj_arr, nbr_arr, nbr_len, n, s, g.directed, buf, count, stop)
+    else:
+        out = [0] * (cap * n)  # linhas achatadas
+        out_count = [0]
+
+    def record(path: List[int]) -> bool:
+        k = out_count[0]
+        out[k * n:(k + 1) * n] = path
+        out_count[0] = k + 1
+        return k + 1 == cap  # True = buffer cheio, parar a busca
+
+    def backtrack(s: int) -> bool:
+        # Backtracking iterativo: pilha explícita por nível (caminho, candidatos
+        # e posição do próximo candidato) em vez de recursão.
+        path = [0] * n
+        cand: List[Tuple[int, ...]] = [()] * n
+        pos = [0] * n
+        path[0] = s
+        visited = 1 << s
+        if visited == full:
+            return record(path)
+        cand[0] = expand(s, visited)
+        depth = 0
+        while depth >= 0:
+            level = cand[depth]
+            if pos[depth] == len(level):
+                visited ^= 1 << path[depth]
+                depth -= 1
+                continue
+            v = level[pos[depth]]
+            pos[depth] += 1
+            depth += 1
+            path[depth] = v
+            visited |= 1 << v
+            if visited == full:
+                if record(path):
+                    return True
+                visited ^= 1 << v
+                depth -= 1
+                continue
+            cand[depth] = expand(v, visited)
+            pos[depth] = 0
         return False
 
-    def try_from(source: str) -> bool:
-        visited: Set[str] = {source}
-        return backtrack(source, visited, [source])
+    def run_jit(pos: int):
+        # Busca isolada (usada em paralelo, só com cap == 1): buffer de 1 linha e
+        # flag de parada próprios do início starts[pos].
+        buf = np.empty((1, n), dtype=np.int64)
+        count = np.zeros(1, dtype=np.int64)
+        run_core(starts[pos], buf, count, stops[pos:pos + 1])
+        if count[0]:
+            stops[pos + 1:] = 1  # inícios posteriores não podem mais vencer
+        return buf[:count[0]]
+
+    def try_from(s: int) -> bool:
+        if use_jit:
+            run_core(s, out, out_count, np.zeros(1, dtype=np.int64))
+            return out_count[0] == cap
+        return backtrack(s)
+
+    starts = sorted((s for s in range(n) if (feasible >> s) & 1), key=deg_arr.__getitem__)
+    workers = os.cpu_count() or 1
 
     if start is not None:
-        if start not in g.adj:
-            raise ValueError(f"O vértice inicial '{start}' não existe no grafo.")
-        try_from(start)
+        try_from(index[start])
+    elif use_jit and cap == 1 and workers > 1 and len(starts) > 1:
+        # Cada vértice inicial é uma busca independente e o núcleo compilado libera
+        # o GIL, então as buscas rodam em threads compartilhando as mesmas tabelas.
+        # Os resultados são consumidos na ordem dos inícios, então o caminho escolhido
+        # é o mesmo da busca sequencial: achar um caminho só interrompe (stops) os
+        # inícios posteriores, nunca os anteriores. Com --all a busca fica
+        # sequencial, para nunca alocar nem gravar mais que cap linhas.
+        stops = np.zeros(len(starts), dtype=np.int64)
+        with ThreadPoolExecutor(max_workers=workers) as ex:
+            futures = [ex.submit(run_jit, pos) for pos in range(len(starts))]
+            for pos, fut in enumerate(futures):
+                rows = fut.result()
+                if len(rows):
+                    out[0] = rows[0]
+                    out_count[0] = 1
+                    for pending in futures[pos + 1:]:
+                        pending.cancel()
+                    break
     else:
         # Tenta iniciar por todos os vértices (ordenados por grau crescente como heurística extra)
-        for v in _order_candidates_by_heuristic(g, vertices):
-            should_stop = try_from(v)
-            if (not all_paths) and results:
+        for s in starts:
+            if try_from(s):  # True = buffer cheio (achou um caminho, ou max_paths com --all)
                 break
 
-    return results
+    k = int(out_count[0])
+    if use_jit:
+        rows = out[:k].tolist()
+    else:
+        rows = (out[i * n:(i + 1) * n] for i in range(k))
+    return [[labels[i] for i in row] for row in rows]
 
 
 def main(argv: Optional[List[str]] = None) -> int:
@@ -195,6 +627,10 @@ def main(argv: Optional[List[str]] = None) -> int:
     parser.add_argument("-i", "--input", help="Caminho do arquivo do grafo (.txt ou .json).", required=True)
     parser.add_argument("--start", help="Vértice inicial (opcional).")
     parser.add_argument("--all", action="store_true", help="Listar todos os caminhos hamiltonianos encontrados.")
+    parser.add_argument("--max-paths", type=int, default=DEFAULT_MAX_PATHS,
+                        help=f"Máximo de caminhos listados com --all (padrão: {DEFAULT_MAX_PATHS}).")
+    parser.add_argument("--specialize", action="store_true",
+                        help="Compila o núcleo (Numba) especializado para o grafo lido; compensa em buscas longas com --all.")
     parser.add_argument("--directed", action="store_true", help="Força interpretação como grafo dirigido (ignora DIRECTED=).")
     args = parser.parse_args(argv)
 
@@ -209,7 +645,8 @@ def main(argv: Optional[List[str]] = None) -> int:
         return 2
 
     try:
-        paths = hamiltonian_paths(g, start=args.start, all_paths=args.all)
+        paths = hamiltonian_paths(g, start=args.start, all_paths=args.all, max_paths=args.max_paths,
+                                  specialize=args.specialize)
     except Exception as e:
         print(f"Erro na busca: {e}", file=sys.stderr)
         return 2
@@ -222,6 +659,9 @@ def main(argv: Optional[List[str]] = None) -> int:
     if args.all:
         for idx, p in enumerate(paths, 1):
             print(f"{idx}: {' -> '.join(p)}")
+        if len(paths) == args.max_paths:
+            print(f"Aviso: limite de --max-paths ({args.max_paths}) atingido; podem existir mais caminhos.",
+                  file=sys.stderr)
     else:
         print("Path:", " -> ".join(paths[0]))
     return 0
@@ -12,6 +12,8 @@ Uso:
 """
 
 import os
+import json
+import hashlib
 import argparse
 
 # Evita depender de backend gráfico (funciona em qualquer ambiente)
@@ -28,20 +30,49 @@ from main import parse_graph, hamiltonian_paths
 def build_nx_graph(g):
     """Converte o Graph do main.py para um grafo networkx."""
     G = nx.DiGraph() if g.directed else nx.Graph()
-    # Adiciona nós
-    for v in g.adj.keys():
-        G.add_node(v)
-    # Adiciona arestas (networkx lida com duplicadas)
-    for u, nbrs in g.adj.items():
-        for v in nbrs:
-            G.add_edge(u, v)
+    # Adiciona nós e arestas em lote
+    G.add_nodes_from(g.adj)
+    edges = ((u, v) for u, nbrs in g.adj.items() for v in nbrs)
+    if not g.directed:
+        # a adjacência não-dirigida guarda u->v e v->u: basta uma das direções
+        edges = ((u, v) for u, v in edges if u <= v)
+    G.add_edges_from(edges)
     return G
 
 
+def cached_layout(G, cache_dir="assets"):
+    """
+    Layout estável (spring_layout com seed fixa), salvo em disco por grafo:
+    o spring_layout é O(iterações * n²), enquanto o hash só percorre as arestas.
+    """
+    if G.is_directed():
+        edges = sorted(G.edges())
+    else:
+        edges = sorted(tuple(sorted(e)) for e in G.edges())
+    key = repr((sorted(G.nodes()), edges, G.is_directed()))
+    h = hashlib.sha1(key.encode("utf-8")).hexdigest()[:16]
+    cache_path = os.path.join(cache_dir, f".layout_{h}.json")
+
+    try:
+        with open(cache_path, "r", encoding="utf-8") as f:
+            return {v: tuple(xy) for v, xy in json.load(f).items()}
+    except (OSError, ValueError):
+        pass  # sem cache (ou cache inválido): calcula de novo
+
+    pos = nx.spring_layout(G, seed=42)
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        with open(cache_path, "w", encoding="utf-8") as f:
+            json.dump({v: [float(x), float(y)] for v, (x, y) in pos.items()}, f)
+    except OSError:
+        pass  # o cache é só otimização
+    return pos
+
+
 def draw_graph(G, path=None, output_path="assets/hamiltoniano.png"):
     """Desenha o grafo e destaca o caminho (se existir)."""
-    # Layout estável
-    pos = nx.spring_layout(G, seed=42)
+    # Layout estável (reaproveitado entre execuções para o mesmo grafo)
+    pos = cached_layout(G, cache_dir=os.path.dirname(output_path) or ".")
 
     # Desenha grafo base
     plt.figure(figsize=(8, 6), dpi=140)